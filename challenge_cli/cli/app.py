@@ -2,36 +2,132 @@
 Main Typer app and command definitions for Challenge CLI.
 """
 
+import os
 import subprocess
+import sys
 from typing import Optional
 
 import typer
 
+from challenge_cli.core.constants import CONTAINER_PREFIX
 from challenge_cli.core.logging import log_warning
 from challenge_cli.output.terminal import console
 
-# Import history and cache commands to register them
-from . import cache, history
 from .completions import Completions
 from .decorators import with_error_handling
 from .handlers import CommandHandlers
-from .options import resolve_options
+from .options import (
+    resolve_language_option,
+    resolve_minimal_options,
+    resolve_options,
+)
+from .params import (
+    CHALLENGE_OPTION,
+    CONFIG_OPTION,
+    DEBUG_OPTION,
+    HISTORY_OPTION,
+    LANGUAGE_OPTION,
+    NO_HISTORY_OPTION,
+    PLATFORM_OPTION,
+)
 
-# Create main typer app
-app = typer.Typer(
+# Create main typer app. Top-level commands are registered on it directly;
+# the history and cache sub-apps are attached by _add_subcommands, either all
+# of them when ``app`` is imported or only the invoked one when running main()
+_app = typer.Typer(
     help="Challenge Testing CLI - A modern CLI for testing coding challenges",
     add_completion=True,
-    rich_markup_mode="markdown",
+    rich_markup_mode="rich",
 )
-# Register history and cache subcommands
-app.add_typer(history.history_app, name="history")
-app.add_typer(cache.cache_app, name="cache")
+
+# Default table layout for listing containers
+_PS_TABLE_FORMAT = "table {{.Names}}\t{{.Status}}\t{{.CreatedAt}}\t{{.RunningFor}}"
+
+# Top-level command names, used to skip building sub-apps that the current
+# invocation cannot reach
+_COMMAND_NAMES = frozenset(
+    {
+        "init",
+        "test",
+        "profile",
+        "analyze",
+        "containers",
+        "ps",
+        "start",
+        "stop",
+        "clean",
+        "history",
+        "cache",
+    }
+)
+
+
+def _requested_command() -> Optional[str]:
+    """Return the top-level command named on the command line, if any.
+
+    During bash completion only the words before the cursor (COMP_CWORD) are
+    considered. Other shells do not report the cursor position, so every
+    sub-app is registered for them. Returns None for --help, bare
+    invocations, unknown commands and while the command name itself is being
+    completed, where every command has to be registered.
+    """
+    if "_CHALLENGE_CLI_COMPLETE" in os.environ:
+        try:
+            cword = int(os.environ["COMP_CWORD"])
+        except (KeyError, ValueError):
+            return None
+        args = os.environ.get("COMP_WORDS", "").split()[1:cword]
+    else:
+        args = sys.argv[1:]
+
+    for arg in args:
+        if not arg.startswith("-"):
+            return arg if arg in _COMMAND_NAMES else None
+    return None
+
+
+_registered_subcommands = set()
+
+
+def _add_subcommands(requested: Optional[str] = None) -> None:
+    """Attach the history and cache sub-apps that ``requested`` can reach.
+
+    With no known command (help, completion of command names) both are added.
+    """
+    if requested in (None, "history") and "history" not in _registered_subcommands:
+        from . import history
+
+        _app.add_typer(history.history_app, name="history")
+        _registered_subcommands.add("history")
+    if requested in (None, "cache") and "cache" not in _registered_subcommands:
+        from . import cache
+
+        _app.add_typer(cache.cache_app, name="cache")
+        _registered_subcommands.add("cache")
+
+
+def __getattr__(name: str):
+    # ``app`` is the complete application, so importers (tests, embedders)
+    # always see every command regardless of the host process's argv
+    if name == "app":
+        _add_subcommands()
+        return _app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def main() -> None:
+    """Console-script entry point.
+
+    Only builds the sub-app for the command being invoked.
+    """
+    _add_subcommands(_requested_command())
+    _app()
 
 
 # ---- Commands ----
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def init(
     challenge_path: str = typer.Option(
@@ -47,13 +143,11 @@ def init(
     function: str = typer.Option(
         "solve", "--function", "-f", help="Function/method name"
     ),
-    platform: Optional[str] = typer.Option(
-        None, "--platform", "-p", help="Platform (leetcode, aoc, etc.)"
-    ),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Initialize a new challenge."""
     options = resolve_options(
@@ -76,34 +170,22 @@ def init(
     CommandHandlers.handle_init(options, challenge_path, language, function)
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def test(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    language: Optional[str] = typer.Option(
-        None,
-        "--language",
-        "-l",
-        help="Programming language",
-        autocompletion=Completions.languages,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
+    language: Optional[str] = LANGUAGE_OPTION,
     detailed: bool = typer.Option(False, "--detailed", "-d", help="Detailed test info"),
     cases: Optional[str] = typer.Option(
         None, "--cases", help="Test cases to run (e.g., '1,2,5-7')"
     ),
     comment: Optional[str] = typer.Option(None, "--comment", help="Snapshot comment"),
     tag: Optional[str] = typer.Option(None, "--tag", help="Snapshot tag"),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Test a solution."""
     options = resolve_options(
@@ -118,23 +200,11 @@ def test(
     CommandHandlers.handle_test(options, challenge_path, detailed, cases, comment, tag)
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def profile(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    language: Optional[str] = typer.Option(
-        None,
-        "--language",
-        "-l",
-        help="Programming language",
-        autocompletion=Completions.languages,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
+    language: Optional[str] = LANGUAGE_OPTION,
     iterations: int = typer.Option(
         100, "--iterations", "-i", help="Profiling iterations"
     ),
@@ -142,11 +212,11 @@ def profile(
     cases: Optional[str] = typer.Option(None, "--cases", "-tc", help="Test cases"),
     comment: Optional[str] = typer.Option(None, "--comment", help="Snapshot comment"),
     tag: Optional[str] = typer.Option(None, "--tag", help="Snapshot tag"),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Profile a solution."""
     options = resolve_options(
@@ -163,16 +233,10 @@ def profile(
     )
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def analyze(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
     language: str = typer.Option(
         "python",
         "--language",
@@ -180,11 +244,11 @@ def analyze(
         help="Programming language (Python only)",
         autocompletion=Completions.languages,
     ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Analyze solution complexity (Python only)."""
     options = resolve_options(
@@ -199,7 +263,63 @@ def analyze(
     CommandHandlers.handle_analyze(options, challenge_path, language)
 
 
-@app.command()
+def _list_containers(
+    filter_language: Optional[str], show_all: bool, format_string: Optional[str]
+) -> None:
+    """Run ``docker ps`` for challenge CLI containers and print the result."""
+    cmd = ["docker", "ps"]
+
+    if show_all:
+        cmd.append("-a")
+
+    # Add filter for challenge-cli containers
+    cmd.extend(["--filter", f"name={CONTAINER_PREFIX}"])
+
+    # Add language filter if specified
+    if filter_language:
+        cmd.extend(["--filter", f"name={CONTAINER_PREFIX}{filter_language}"])
+
+    # Add format
+    cmd.extend(["--format", format_string or _PS_TABLE_FORMAT])
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+
+    if result.stdout.strip():
+        if not format_string:  # Only add header if using default format
+            console.print("[bold]Challenge CLI Containers:[/bold]")
+        console.print(result.stdout)
+    else:
+        filter_msg = f" for language '{filter_language}'" if filter_language else ""
+        console.print(f"[yellow]No challenge CLI containers found{filter_msg}[/yellow]")
+
+
+def _container_status(container_name: str) -> Optional[str]:
+    """Return the ``docker ps`` status of a container, or None if it doesn't exist.
+
+    ``--filter name=`` matches substrings (``challenge-cli-c`` also matches
+    ``challenge-cli-cpp``), so the exact name is picked from the output.
+    """
+    result = subprocess.run(
+        [
+            "docker",
+            "ps",
+            "-a",
+            "--filter",
+            f"name={container_name}",
+            "--format",
+            "{{.Names}}\t{{.Status}}",
+        ],
+        capture_output=True,
+        text=True,
+    )
+    for line in result.stdout.splitlines():
+        name, _, status = line.partition("\t")
+        if name == container_name:
+            return status
+    return None
+
+
+@_app.command()
 @with_error_handling
 def containers(
     filter_language: Optional[str] = typer.Option(
@@ -220,48 +340,17 @@ def containers(
     ),
 ):
     """List challenge CLI containers."""
-    cmd = ["docker", "ps"]
-
-    if all:
-        cmd.append("-a")
-
-    # Add filter for challenge-cli containers
-    cmd.extend(["--filter", "name=challenge-cli-"])
-
-    # Add language filter if specified
-    if filter_language:
-        cmd.extend(["--filter", f"name=challenge-cli-{filter_language}"])
-
-    # Add format
-    if format:
-        cmd.extend(["--format", format])
-    else:
-        cmd.extend(
-            [
-                "--format",
-                "table {{.Names}}\t{{.Status}}\t{{.CreatedAt}}\t{{.RunningFor}}",
-            ]
-        )
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    _list_containers(filter_language, all, format)
 
-    if result.stdout.strip():
-        if not format:  # Only add header if using default format
-            console.print("[bold]Challenge CLI Containers:[/bold]")
-        console.print(result.stdout)
-    else:
-        filter_msg = f" for language '{filter_language}'" if filter_language else ""
-        console.print(f"[yellow]No challenge CLI containers found{filter_msg}[/yellow]")
 
-
-@app.command(name="ps")
+@_app.command(name="ps")
 @with_error_handling
 def ps():
     """Alias for 'containers' command - list all challenge CLI containers."""
-    containers(filter_language=None, all=True, format=None)
+    _list_containers(filter_language=None, show_all=True, format_string=None)
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def start(
     language: str = typer.Option(
@@ -271,12 +360,10 @@ def start(
         help="Language to start container for",
         autocompletion=Completions.languages,
     ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
 ):
     """Pre-start a container for a specific language."""
-    import os
-
     from challenge_cli.plugins import get_plugin
     from challenge_cli.plugins.docker_utils import start_hot_container
 
@@ -286,40 +373,37 @@ def start(
         config_override=config,
     )
 
-    try:
-        plugin = get_plugin(language)
-        if not plugin:
-            console.print(
-                f"[bold red]Error:[/bold red] No plugin found for language '{language}'"
-            )
-            raise typer.Exit(code=1)
-
-        plugin.ensure_image()
+    # PLUGINS is keyed by canonical name, so look up the resolved language
+    # (e.g. "py" -> "python")
+    plugin = get_plugin(options.language)
+    if not plugin:
+        console.print(
+            f"[bold red]Error:[/bold red] No plugin found for language '{language}'"
+        )
+        raise typer.Exit(code=1)
 
-        # Create a dummy workdir for pre-warming
-        dummy_workdir = "/tmp/challenge-cli-warmup"
-        os.makedirs(dummy_workdir, exist_ok=True)
+    plugin.ensure_image()
 
-        container_name = f"challenge-cli-{language}"
+    # Create a dummy workdir for pre-warming
+    dummy_workdir = "/tmp/challenge-cli-warmup"
+    os.makedirs(dummy_workdir, exist_ok=True)
 
-        # Start the container
-        start_hot_container(
-            plugin.docker_image,
-            dummy_workdir,
-            container_name,
-            problems_dir=str(options.config.problems_dir),
-            cache_dir=str(options.config.get_cache_dir()),
-        )
+    container_name = f"{CONTAINER_PREFIX}{plugin.name}"
 
-        console.print(f"[green]✓[/green] Started container for {language}")
-        console.print(f"[dim]Container name: {container_name}[/dim]")
+    # Start the container
+    start_hot_container(
+        plugin.docker_image,
+        dummy_workdir,
+        container_name,
+        problems_dir=str(options.config.problems_dir),
+        cache_dir=str(options.config.get_cache_dir()),
+    )
 
-    except Exception as e:
-        console.print(f"[bold red]Error:[/bold red] Failed to start container: {e}")
-        raise typer.Exit(code=1)
+    console.print(f"[green]✓[/green] Started container for {plugin.name}")
+    console.print(f"[dim]Container name: {container_name}[/dim]")
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def stop(
     language: Optional[str] = typer.Option(
@@ -334,7 +418,10 @@ def stop(
     ),
 ):
     """Stop challenge CLI containers."""
-    from challenge_cli.plugins.docker_utils import shutdown_container
+    from challenge_cli.plugins.docker_utils import (
+        shutdown_container,
+        shutdown_containers,
+    )
 
     if not language and not all:
         console.print("[bold red]Error:[/bold red] Please specify --language or --all")
@@ -347,7 +434,7 @@ def stop(
                 "docker",
                 "ps",
                 "--filter",
-                "name=challenge-cli-",
+                f"name={CONTAINER_PREFIX}",
                 "--format",
                 "{{.Names}}",
             ],
@@ -362,36 +449,30 @@ def stop(
             console.print("[yellow]No running challenge CLI containers found[/yellow]")
             return
 
+        if not shutdown_containers(container_names):
+            console.print("[bold red]Error:[/bold red] Failed to stop containers")
+            raise typer.Exit(code=1)
         for container_name in container_names:
-            shutdown_container(container_name)
             console.print(f"[green]✓[/green] Stopped container: {container_name}")
     else:
-        # Stop specific language container
-        container_name = f"challenge-cli-{language}"
+        from challenge_cli.plugins.registry import resolve_language
 
-        # Check if container exists
-        result = subprocess.run(
-            [
-                "docker",
-                "ps",
-                "-a",
-                "--filter",
-                f"name={container_name}",
-                "--format",
-                "{{.Names}}",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        # Stop specific language container; start names it after the
+        # canonical language, so resolve aliases like "py"
+        container_name = f"{CONTAINER_PREFIX}{resolve_language(language)}"
 
-        if container_name in result.stdout:
-            shutdown_container(container_name)
+        if _container_status(container_name) is None:
+            console.print(f"[yellow]Container '{container_name}' not found[/yellow]")
+        elif shutdown_container(container_name):
             console.print(f"[green]✓[/green] Stopped container: {container_name}")
         else:
-            console.print(f"[yellow]Container '{container_name}' not found[/yellow]")
+            console.print(
+                f"[bold red]Error:[/bold red] Failed to stop container: {container_name}"
+            )
+            raise typer.Exit(code=1)
 
 
-@app.command()
+@_app.command()
 @with_error_handling
 def clean(
     language: Optional[str] = typer.Option(
@@ -403,39 +484,27 @@ def clean(
     force: bool = typer.Option(
         False, "--force", "-f", help="Force remove running containers"
     ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
 ):
     """Remove challenge CLI containers."""
-    options = resolve_options(
-        language_override=language,
+    options = resolve_minimal_options(
         platform_override=platform,
         config_override=config,
         debug_override=debug,
     )
 
     if language:
-        # Clean specific language container
-        container_name = f"challenge-cli-{language}"
+        # Clean specific language container; resolving here validates the
+        # name and maps aliases to the canonical container name
+        language = resolve_language_option(options.config, language)
+        container_name = f"{CONTAINER_PREFIX}{language}"
 
-        # Check container status
-        result = subprocess.run(
-            [
-                "docker",
-                "ps",
-                "-a",
-                "--filter",
-                f"name={container_name}",
-                "--format",
-                "{{.Status}}",
-            ],
-            capture_output=True,
-            text=True,
-        )
+        status = _container_status(container_name)
 
-        if result.stdout:
-            is_running = "Up" in result.stdout
+        if status is not None:
+            is_running = status.startswith("Up")
 
             if is_running and not force and not stopped:
                 console.print(
@@ -444,7 +513,15 @@ def clean(
                 raise typer.Exit(code=1)
 
             if not is_running or force:
-                subprocess.run(["docker", "rm", "-f", container_name], check=False)
+                result = subprocess.run(
+                    ["docker", "rm", "-f", container_name], check=False
+                )
+                if result.returncode != 0:
+                    console.print(
+                        "[bold red]Error:[/bold red] Failed to remove container: "
+                        f"{container_name}"
+                    )
+                    raise typer.Exit(code=1)
                 console.print(f"[green]✓[/green] Removed container: {container_name}")
             else:
                 console.print(
@@ -458,4 +535,4 @@ def clean(
 
 
 if __name__ == "__main__":
-    app()
+    main()
@@ -1,9 +1,13 @@
 """Cache management utilities for challenge CLI."""
 
+import datetime
 import os
 import shutil
+import time
+from collections import Counter
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Iterator, Optional, Union
 
 from challenge_cli.core.config import get_config
 from challenge_cli.output.terminal import (
@@ -13,26 +17,52 @@ from challenge_cli.output.terminal import (
     print_warning,
 )
 
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+
+@dataclass(slots=True)
+class LangStats:
+    """Cache statistics for a single language directory."""
+
+    total_size: int = 0
+    file_count: int = 0
+    file_types: Counter = field(default_factory=Counter)
+    oldest_file: float = float("inf")
+    newest_file: float = 0.0
+
+
+def _iter_files(path: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """Yield file entries below ``path``, not following directory symlinks."""
+    stack = [os.fspath(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry
+        except OSError:
+            # Directory vanished or is unreadable; skip it like os.walk does
+            continue
+
 
-def get_directory_size(path: Path) -> int:
+def get_directory_size(path: Union[str, Path]) -> int:
     """Get the total size of a directory in bytes."""
     total_size = 0
-    if path.exists():
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.exists(filepath):
-                    total_size += os.path.getsize(filepath)
+    for entry in _iter_files(path):
+        try:
+            total_size += entry.stat().st_size
+        except OSError:
+            continue
     return total_size
 
 
 def format_size(size_bytes: int) -> str:
     """Format size in bytes to human-readable string."""
-    for unit in ["B", "KB", "MB", "GB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} TB"
+    # Each unit is 2**10 times the previous one, so the bit length picks it
+    index = max(0, min((size_bytes.bit_length() - 1) // 10, len(_SIZE_UNITS) - 1))
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def show_cache_info():
@@ -44,19 +74,28 @@ def show_cache_info():
         print_warning("No cache directory found")
         return
 
-    total_size = get_directory_size(cache_dir)
+    # Size each language directory once; the total is their sum plus any
+    # loose top-level files (symlinked directories are listed, not counted)
+    total_size = 0
+    languages = []
+    with os.scandir(cache_dir) as entries:
+        for entry in entries:
+            if entry.is_dir():
+                lang_size = get_directory_size(entry.path)
+                languages.append((entry.name, lang_size))
+                if not entry.is_symlink():
+                    total_size += lang_size
+            elif entry.is_file():
+                try:
+                    total_size += entry.stat().st_size
+                except OSError:
+                    continue
 
     console.print(f"[bold]Cache Location:[/bold] {cache_dir}")
     console.print(f"[bold]Total Size:[/bold] {format_size(total_size)}")
     console.print()
 
     # Show breakdown by language
-    languages = []
-    for item in cache_dir.iterdir():
-        if item.is_dir():
-            lang_size = get_directory_size(item)
-            languages.append((item.name, lang_size))
-
     if languages:
         console.print("[bold]Usage by Language:[/bold]")
         for lang, size in sorted(languages, key=lambda x: x[1], reverse=True):
@@ -97,65 +136,46 @@ def show_cache_statistics():
         print_warning("No cache directory found")
         return
 
-    stats: Dict[str, Dict] = {}
+    stats: Dict[str, LangStats] = {}
 
-    for lang_dir in cache_dir.iterdir():
-        if not lang_dir.is_dir():
-            continue
+    with os.scandir(cache_dir) as entries:
+        lang_dirs = [entry for entry in entries if entry.is_dir()]
+
+    for lang_dir in lang_dirs:
+        lang_stats = stats[lang_dir.name] = LangStats()
+        file_types = lang_stats.file_types
+
+        for entry in _iter_files(lang_dir.path):
+            try:
+                file_stat = entry.stat()
+            except OSError:
+                continue
+            mtime = file_stat.st_mtime
+            lang_stats.total_size += file_stat.st_size
+            lang_stats.file_count += 1
+            file_types[os.path.splitext(entry.name)[1]] += 1
 
-        lang_stats = {
-            "total_size": 0,
-            "file_count": 0,
-            "file_types": {},
-            "oldest_file": None,
-            "newest_file": None,
-        }
-
-        for root, dirs, files in os.walk(lang_dir):
-            for file in files:
-                filepath = Path(root) / file
-                if filepath.exists():
-                    file_stat = filepath.stat()
-                    lang_stats["total_size"] += file_stat.st_size
-                    lang_stats["file_count"] += 1
-
-                    # Track file types
-                    ext = filepath.suffix
-                    if ext not in lang_stats["file_types"]:
-                        lang_stats["file_types"][ext] = 0
-                    lang_stats["file_types"][ext] += 1
-
-                    # Track oldest/newest
-                    if (
-                        lang_stats["oldest_file"] is None
-                        or file_stat.st_mtime < lang_stats["oldest_file"]
-                    ):
-                        lang_stats["oldest_file"] = file_stat.st_mtime
-                    if (
-                        lang_stats["newest_file"] is None
-                        or file_stat.st_mtime > lang_stats["newest_file"]
-                    ):
-                        lang_stats["newest_file"] = file_stat.st_mtime
-
-        stats[lang_dir.name] = lang_stats
+            # Track oldest/newest
+            if mtime < lang_stats.oldest_file:
+                lang_stats.oldest_file = mtime
+            if mtime > lang_stats.newest_file:
+                lang_stats.newest_file = mtime
 
     # Display statistics
     console.print("[bold]Cache Statistics:[/bold]")
     for lang, lang_stats in stats.items():
         console.print(f"\n[bold cyan]{lang}:[/bold cyan]")
-        console.print(f"  Total Size: {format_size(lang_stats['total_size'])}")
-        console.print(f"  File Count: {lang_stats['file_count']}")
+        console.print(f"  Total Size: {format_size(lang_stats.total_size)}")
+        console.print(f"  File Count: {lang_stats.file_count}")
 
-        if lang_stats["file_types"]:
+        if lang_stats.file_types:
             console.print("  File Types:")
-            for ext, count in sorted(lang_stats["file_types"].items()):
+            for ext, count in sorted(lang_stats.file_types.items()):
                 console.print(f"    {ext or '(no extension)'}: {count}")
 
-        if lang_stats["oldest_file"] and lang_stats["newest_file"]:
-            import datetime
-
-            oldest = datetime.datetime.fromtimestamp(lang_stats["oldest_file"])
-            newest = datetime.datetime.fromtimestamp(lang_stats["newest_file"])
+        if lang_stats.file_count:
+            oldest = datetime.datetime.fromtimestamp(lang_stats.oldest_file)
+            newest = datetime.datetime.fromtimestamp(lang_stats.newest_file)
             console.print(f"  Oldest File: {oldest.strftime('%Y-%m-%d %H:%M:%S')}")
             console.print(f"  Newest File: {newest.strftime('%Y-%m-%d %H:%M:%S')}")
 
@@ -169,23 +189,22 @@ def clean_old_cache(days: int = 7):
         print_warning("No cache directory found")
         return
 
-    import time
-
     current_time = time.time()
     cutoff_time = current_time - (days * 24 * 60 * 60)
 
     files_removed = 0
     size_freed = 0
 
-    for root, dirs, files in os.walk(cache_dir):
-        for file in files:
-            filepath = Path(root) / file
-            if filepath.exists():
-                file_stat = filepath.stat()
-                if file_stat.st_mtime < cutoff_time:
-                    size_freed += file_stat.st_size
-                    filepath.unlink()
-                    files_removed += 1
+    for entry in _iter_files(cache_dir):
+        try:
+            file_stat = entry.stat()
+            if file_stat.st_mtime < cutoff_time:
+                os.unlink(entry.path)
+                size_freed += file_stat.st_size
+                files_removed += 1
+        except FileNotFoundError:
+            # Removed concurrently, e.g. by a running container
+            continue
 
     if files_removed > 0:
         print_success(f"Removed {files_removed} files older than {days} days")
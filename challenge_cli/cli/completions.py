@@ -2,11 +2,131 @@
 Autocompletion functions for Challenge CLI.
 """
 
+import hashlib
+import json
 import os
-from typing import List
+import time
+from typing import Dict, List, Optional, Tuple
 
 from challenge_cli.core.config import HISTORY_DIR_NAME, load_config_file
 
+# Directories never offered as challenges and never descended into
+_SKIPPED_DIRS = frozenset({HISTORY_DIR_NAME, "__pycache__"})
+_LANGUAGE_DIRS = frozenset({"python", "go", "javascript"})
+
+# Scans are not cached while a directory changed this recently: a change
+# within the same mtime tick (2s on FAT, coarse on SMB/NFS) would otherwise
+# leave the cache stale until some later change
+_MTIME_SETTLE_NS = 2_000_000_000
+
+# Language names and aliases offered by --language completion, pre-sorted
+_LANGUAGE_CHOICES = ("go", "golang", "javascript", "js", "py", "python")
+
+
+def _find_challenges(platform_dir: str) -> Tuple[List[str], Dict[str, int]]:
+    """Collect challenge paths under a platform directory, relative to it.
+
+    Hidden, history and cache directories as well as language directories are
+    pruned before descending, so their contents are never listed.
+
+    Returns:
+        The sorted challenge paths and the mtime of every directory scanned,
+        keyed by relative path ("" for the platform directory itself).
+    """
+    challenges = set()
+    mtimes = {"": os.stat(platform_dir).st_mtime_ns}
+    stack = [(platform_dir, "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if (
+                        name.startswith(".")
+                        or name in _SKIPPED_DIRS
+                        or name in _LANGUAGE_DIRS
+                        or not entry.is_dir()
+                    ):
+                        continue
+                    rel_path = prefix + name
+                    challenges.add(rel_path)
+                    if not entry.is_symlink():
+                        mtimes[rel_path] = entry.stat().st_mtime_ns
+                        stack.append((entry.path, rel_path + os.sep))
+        except OSError:
+            continue
+
+    return sorted(challenges), mtimes
+
+
+def _challenge_cache_file(platform_dir: str) -> str:
+    """Location of the on-disk completion cache for a platform directory."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    key = hashlib.sha1(os.path.abspath(platform_dir).encode()).hexdigest()[:16]
+    return os.path.join(cache_home, "challenge-cli", f"complete-{key}.json")
+
+
+def _load_cached_challenges(cache_file: str, platform_dir: str) -> Optional[List[str]]:
+    """Return cached challenge paths, or None if missing or stale.
+
+    The cache is valid while every scanned directory keeps its mtime: adding
+    or removing a challenge changes the mtime of its parent directory.
+    """
+    try:
+        with open(cache_file, "r") as f:
+            cached = json.load(f)
+        for rel_path, mtime_ns in cached["mtimes"].items():
+            if os.stat(os.path.join(platform_dir, rel_path)).st_mtime_ns != mtime_ns:
+                return None
+        return cached["challenges"]
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+
+
+def _save_cached_challenges(
+    cache_file: str, challenges: List[str], mtimes: Dict[str, int]
+) -> None:
+    """Atomically write the completion cache, ignoring failures."""
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(tmp_file, "w") as f:
+            json.dump({"mtimes": mtimes, "challenges": challenges}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError:
+        pass
+
+
+def _get_challenges(platform_dir: str) -> List[str]:
+    """Challenge paths for a platform directory, served from disk when fresh."""
+    cache_file = _challenge_cache_file(platform_dir)
+    challenges = _load_cached_challenges(cache_file, platform_dir)
+    if challenges is None:
+        scan_started_ns = time.time_ns()
+        challenges, mtimes = _find_challenges(platform_dir)
+        if max(mtimes.values()) < scan_started_ns - _MTIME_SETTLE_NS:
+            _save_cached_challenges(cache_file, challenges, mtimes)
+    return challenges
+
+
+def _completion_defaults() -> Tuple[str, str]:
+    """Problems directory and platform used to resolve completions.
+
+    The CHALLENGE_CLI_PROBLEMS_DIR and CHALLENGE_CLI_DEFAULT_PLATFORM
+    environment variables take precedence; the config file is only read when
+    one of them is unset.
+    """
+    problems_dir = os.environ.get("CHALLENGE_CLI_PROBLEMS_DIR")
+    platform = os.environ.get("CHALLENGE_CLI_DEFAULT_PLATFORM")
+    if not (problems_dir and platform):
+        config = load_config_file()
+        problems_dir = problems_dir or config.get("problems_dir", os.getcwd())
+        platform = platform or config.get("default_platform", "leetcode")
+    return problems_dir, platform
+
 
 class Completions:
     """Autocompletion provider for Challenge CLI."""
@@ -14,34 +134,19 @@ class Completions:
     @staticmethod
     def challenges(incomplete: str) -> List[str]:
         """Complete challenge paths."""
-        config = load_config_file()
-        problems_dir = config.get("problems_dir", os.getcwd())
-        platform = config.get("default_platform", "leetcode")
+        problems_dir, platform = _completion_defaults()
 
         platform_dir = os.path.join(problems_dir, platform)
         if not os.path.exists(platform_dir):
             return []
 
-        challenges = []
-        for root, dirs, _ in os.walk(platform_dir):
-            if HISTORY_DIR_NAME in root or "/." in root or "/__pycache__" in root:
-                continue
-            rel_path = os.path.relpath(root, platform_dir)
-            if rel_path != "." and not any(
-                lang in rel_path.split(os.sep)
-                for lang in ["python", "go", "javascript"]
-            ):
-                challenges.append(rel_path)
-            else:
-                challenges.extend(d for d in dirs if not d.startswith("."))
-
-        return [c for c in sorted(set(challenges)) if c.startswith(incomplete)]
+        return [c for c in _get_challenges(platform_dir) if c.startswith(incomplete)]
 
     @staticmethod
     def languages(incomplete: str) -> List[str]:
         """Complete language options."""
-        langs = ["python", "py", "javascript", "js", "go", "golang"]
-        return [lang for lang in langs if lang.startswith(incomplete.lower())]
+        prefix = incomplete.lower()
+        return [lang for lang in _LANGUAGE_CHOICES if lang.startswith(prefix)]
 
     @staticmethod
     def snapshots(ctx, incomplete: str) -> List[str]:
@@ -50,23 +155,22 @@ class Completions:
         if not challenge_path:
             return []
 
-        config = load_config_file()
-        problems_dir = config.get("problems_dir", os.getcwd())
-        platform = ctx.params.get("platform") or config.get(
-            "default_platform", "leetcode"
-        )
+        problems_dir, default_platform = _completion_defaults()
+        platform = ctx.params.get("platform") or default_platform
 
-        history_dir = os.path.join(
-            problems_dir, platform, challenge_path, HISTORY_DIR_NAME
+        snapshots_dir = os.path.join(
+            problems_dir, platform, challenge_path, HISTORY_DIR_NAME, "snapshots"
         )
-        snapshots_dir = os.path.join(history_dir, "snapshots")
-        if not os.path.exists(snapshots_dir):
+        needle = incomplete.casefold()
+        try:
+            with os.scandir(snapshots_dir) as entries:
+                matches = [
+                    entry.name
+                    for entry in entries
+                    if needle in entry.name.casefold() and entry.is_dir()
+                ]
+        except OSError:
             return []
 
-        return sorted(
-            [
-                item
-                for item in os.listdir(snapshots_dir)
-                if incomplete.lower() in item.lower()
-            ]
-        )
+        matches.sort()
+        return matches
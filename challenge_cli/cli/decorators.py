@@ -6,9 +6,8 @@ from functools import wraps
 from typing import Callable
 
 import typer
-from rich.console import Console
 
-console = Console()
+from challenge_cli.output.terminal import console
 
 
 def with_error_handling(func: Callable) -> Callable:
@@ -18,10 +17,13 @@ def with_error_handling(func: Callable) -> Callable:
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
+        except typer.Exit:
+            # Commands exit deliberately after printing their own message
+            raise
         except Exception as e:
             console.print(f"[bold red]Error in {func.__name__}:[/bold red] {e}")
             options = kwargs.get("options")
-            if options and hasattr(options, "debug") and options.debug:
+            if kwargs.get("debug") or getattr(options, "debug", False):
                 import traceback
 
                 console.print(traceback.format_exc())
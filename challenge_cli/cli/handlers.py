@@ -2,7 +2,7 @@
 Command handlers for Challenge CLI - business logic separated from CLI interface.
 """
 
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from challenge_cli.core.logging import (
     log_context,
@@ -11,18 +11,24 @@ from challenge_cli.core.logging import (
     log_warning,
     logged_operation,
 )
-from challenge_cli.plugins.docker_utils import shutdown_all_containers
-from challenge_cli.runners.orchestrator import ChallengeTester
 
 from .options import ResolvedOptions
 
+if TYPE_CHECKING:
+    from challenge_cli.runners.orchestrator import ChallengeTester
+
 
 class CommandHandlers:
     """Handles the business logic for CLI commands."""
 
     @staticmethod
-    def create_tester(options: ResolvedOptions, challenge_path: str) -> ChallengeTester:
+    def create_tester(
+        options: ResolvedOptions, challenge_path: str
+    ) -> "ChallengeTester":
         """Factory method to create ChallengeTester with common parameters."""
+        # Import here so commands that never run a challenge skip the tester stack
+        from challenge_cli.runners.orchestrator import ChallengeTester
+
         return ChallengeTester(
             platform=options.platform,
             challenge_path=challenge_path,
@@ -132,6 +138,8 @@ class CommandHandlers:
     @logged_operation("clean_command")
     def handle_clean(options: ResolvedOptions):
         """Handle the clean command."""
+        from challenge_cli.plugins.docker_utils import shutdown_all_containers
+
         with log_context(platform=options.platform):
             log_info("Shutting down all running challenge containers")
             shutdown_all_containers()
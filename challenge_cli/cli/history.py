@@ -12,7 +12,21 @@ from challenge_cli.output.terminal import console
 from .completions import Completions
 from .decorators import with_error_handling
 from .handlers import HistoryCommandHandlers
-from .options import resolve_options
+from .options import (
+    resolve_language_option,
+    resolve_minimal_options,
+    resolve_options,
+)
+from .params import (
+    CHALLENGE_OPTION,
+    CONFIG_OPTION,
+    DEBUG_OPTION,
+    HISTORY_OPTION,
+    LANGUAGE_OPTION,
+    NO_HISTORY_OPTION,
+    PLATFORM_OPTION,
+    SNAPSHOT_OPTION,
+)
 
 # Create history subcommand group
 history_app = typer.Typer(help="Manage solution history")
@@ -21,30 +35,17 @@ history_app = typer.Typer(help="Manage solution history")
 @history_app.command("list")
 @with_error_handling
 def history_list(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    language: Optional[str] = typer.Option(
-        None,
-        "--language",
-        "-l",
-        help="Programming language",
-        autocompletion=Completions.languages,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
+    language: Optional[str] = LANGUAGE_OPTION,
     limit: int = typer.Option(10, "--limit", "-n", help="Number of snapshots to show"),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """List solution snapshots."""
-    options = resolve_options(
-        language_override=language,
+    options = resolve_minimal_options(
         platform_override=platform,
         config_override=config,
         debug_override=debug,
@@ -57,31 +58,22 @@ def history_list(
         console.print("[yellow]History is disabled. Cannot list snapshots.[/yellow]")
         raise typer.Exit()
 
+    # Only now resolve --language: it imports the plugin registry
+    options.language = resolve_language_option(options.config, language)
+
     HistoryCommandHandlers.handle_list(options, challenge_path, limit)
 
 
 @history_app.command("show")
 @with_error_handling
 def history_show(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    snapshot_id: str = typer.Option(
-        ...,
-        "--snapshot",
-        "-s",
-        help="Snapshot ID",
-        autocompletion=Completions.snapshots,
-    ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    challenge_path: str = CHALLENGE_OPTION,
+    snapshot_id: str = SNAPSHOT_OPTION,
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Show details of a specific snapshot."""
     options = resolve_options(
@@ -103,13 +95,7 @@ def history_show(
 @history_app.command("compare")
 @with_error_handling
 def history_compare(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
     snapshot1: str = typer.Option(
         ...,
         "--first",
@@ -124,11 +110,11 @@ def history_compare(
         help="Second snapshot ID",
         autocompletion=Completions.snapshots,
     ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Compare two snapshots."""
     options = resolve_options(
@@ -150,28 +136,16 @@ def history_compare(
 @history_app.command("restore")
 @with_error_handling
 def history_restore(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    snapshot_id: str = typer.Option(
-        ...,
-        "--snapshot",
-        "-s",
-        help="Snapshot ID",
-        autocompletion=Completions.snapshots,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
+    snapshot_id: str = SNAPSHOT_OPTION,
     backup: bool = typer.Option(
         False, "--backup", "-b", help="Backup before restoring"
     ),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Restore a snapshot."""
     options = resolve_options(
@@ -193,33 +167,20 @@ def history_restore(
 @history_app.command("visualize")
 @with_error_handling
 def history_visualize(
-    challenge_path: str = typer.Option(
-        ...,
-        "--challenge",
-        "-c",
-        help="Challenge path",
-        autocompletion=Completions.challenges,
-    ),
-    language: Optional[str] = typer.Option(
-        None,
-        "--language",
-        "-l",
-        help="Programming language",
-        autocompletion=Completions.languages,
-    ),
+    challenge_path: str = CHALLENGE_OPTION,
+    language: Optional[str] = LANGUAGE_OPTION,
     output_path: Optional[str] = typer.Option(
         None, "--output", "-o", help="Output file (e.g., history.html)"
     ),
     cases: Optional[str] = typer.Option(None, "--cases", help="Test cases to include"),
-    platform: Optional[str] = typer.Option(None, "--platform", "-p", help="Platform"),
-    config: Optional[str] = typer.Option(None, "--config", help="Config file"),
-    debug: bool = typer.Option(False, "--debug", help="Debug mode"),
-    history: Optional[bool] = typer.Option(None, "--history", help="Enable history"),
-    no_history: bool = typer.Option(False, "--no-history", help="Disable history"),
+    platform: Optional[str] = PLATFORM_OPTION,
+    config: Optional[str] = CONFIG_OPTION,
+    debug: bool = DEBUG_OPTION,
+    history: Optional[bool] = HISTORY_OPTION,
+    no_history: bool = NO_HISTORY_OPTION,
 ):
     """Visualize solution history."""
-    options = resolve_options(
-        language_override=language,
+    options = resolve_minimal_options(
         platform_override=platform,
         config_override=config,
         debug_override=debug,
@@ -232,4 +193,7 @@ def history_visualize(
         console.print("[yellow]History is disabled. Cannot visualize history.[/yellow]")
         raise typer.Exit()
 
+    # Only now resolve --language: it imports the plugin registry
+    options.language = resolve_language_option(options.config, language)
+
     HistoryCommandHandlers.handle_visualize(options, challenge_path, output_path, cases)
@@ -5,9 +5,8 @@ Resolved options and configuration handling for Challenge CLI.
 from dataclasses import dataclass
 from typing import Optional
 
-from challenge_cli.core.config import ChallengeConfig, load_config_file
+from challenge_cli.core.config import ChallengeConfig, load_config_file, set_config
 from challenge_cli.core.logging import configure_logging, log_debug, log_info
-from challenge_cli.plugins.registry import resolve_language
 
 
 @dataclass
@@ -23,15 +22,15 @@ class ResolvedOptions:
     config: ChallengeConfig  # Include the full config object
 
 
-def resolve_options(
-    language_override: Optional[str] = None,
-    platform_override: Optional[str] = None,
-    config_override: Optional[str] = None,
-    debug_override: bool = False,
-    history_override: Optional[bool] = None,
-    no_history_override: bool = False,
-) -> ResolvedOptions:
-    """Resolves options based on command args, config files, and defaults."""
+def _load_config(
+    platform_override: Optional[str],
+    config_override: Optional[str],
+    debug_override: bool,
+) -> ChallengeConfig:
+    """Configure logging, load the config file and apply platform/debug overrides.
+
+    The result is also installed as the global config (see ``get_config``).
+    """
     # Configure logging first
     configure_logging(debug=debug_override)
 
@@ -50,24 +49,20 @@ def resolve_options(
     if debug_override:
         config.debug = True
 
-    # Resolve language
-    language = None
-    if language_override:
-        log_debug(f"Resolving language from override: {language_override}")
-        language = resolve_language(language_override)
-    elif config.language:
-        log_debug(f"Using language from config: {config.language}")
-        language = config.language
-    else:
-        # Try platform-specific config
-        platform_config = config.get_platform_config()
-        if platform_config.language:
-            log_debug(
-                f"Using language from platform config: {platform_config.language}"
-            )
-            language = platform_config.language
-
-    # Resolve history settings
+    # Publish the resolved config so get_config() in the tester stack
+    # (plugins, docker utils, cache management) reuses it instead of
+    # loading the file again
+    set_config(config)
+
+    return config
+
+
+def resolve_use_history(
+    config: ChallengeConfig,
+    history_override: Optional[bool] = None,
+    no_history_override: bool = False,
+) -> bool:
+    """Apply --history/--no-history on top of the configured history setting."""
     use_history = config.history.enabled
 
     # Command-line flags override config
@@ -78,6 +73,45 @@ def resolve_options(
         log_debug("History disabled via --no-history flag")
         use_history = False  # --no-history takes precedence
 
+    return use_history
+
+
+def resolve_language_option(
+    config: ChallengeConfig, language_override: Optional[str] = None
+) -> Optional[str]:
+    """Resolve the language from --language, then the config, then the platform."""
+    if language_override:
+        # Import here: the plugin registry loads every language plugin and
+        # docker_utils, which --help and shell completion never need
+        from challenge_cli.plugins.registry import resolve_language
+
+        log_debug(f"Resolving language from override: {language_override}")
+        return resolve_language(language_override)
+    if config.language:
+        log_debug(f"Using language from config: {config.language}")
+        return config.language
+
+    # Try platform-specific config
+    platform_config = config.get_platform_config()
+    if platform_config.language:
+        log_debug(f"Using language from platform config: {platform_config.language}")
+    return platform_config.language
+
+
+def resolve_options(
+    language_override: Optional[str] = None,
+    platform_override: Optional[str] = None,
+    config_override: Optional[str] = None,
+    debug_override: bool = False,
+    history_override: Optional[bool] = None,
+    no_history_override: bool = False,
+) -> ResolvedOptions:
+    """Resolves options based on command args, config files, and defaults."""
+    config = _load_config(platform_override, config_override, debug_override)
+
+    use_history = resolve_use_history(config, history_override, no_history_override)
+    language = resolve_language_option(config, language_override)
+
     resolved = ResolvedOptions(
         platform=config.platform,
         problems_dir=str(config.problems_dir),
@@ -96,3 +130,29 @@ def resolve_options(
     )
 
     return resolved
+
+
+def resolve_minimal_options(
+    platform_override: Optional[str] = None,
+    config_override: Optional[str] = None,
+    debug_override: bool = False,
+    history_override: Optional[bool] = None,
+    no_history_override: bool = False,
+) -> ResolvedOptions:
+    """Resolves platform, debug and history settings only.
+
+    For commands that may bail out before needing a language (e.g. ``clean``,
+    or history commands with history disabled): language resolution, which
+    imports the plugin registry, is left to ``resolve_language_option``.
+    """
+    config = _load_config(platform_override, config_override, debug_override)
+
+    return ResolvedOptions(
+        platform=config.platform,
+        problems_dir=str(config.problems_dir),
+        use_history=resolve_use_history(config, history_override, no_history_override),
+        max_snapshots=config.history.max_snapshots,
+        language=None,
+        debug=config.debug,
+        config=config,
+    )
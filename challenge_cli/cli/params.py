@@ -0,0 +1,36 @@
+"""
+Shared Typer option declarations for Challenge CLI commands.
+"""
+
+import typer
+
+from .completions import Completions
+
+CHALLENGE_OPTION = typer.Option(
+    ...,
+    "--challenge",
+    "-c",
+    help="Challenge path",
+    autocompletion=Completions.challenges,
+)
+LANGUAGE_OPTION = typer.Option(
+    None,
+    "--language",
+    "-l",
+    help="Programming language",
+    autocompletion=Completions.languages,
+)
+PLATFORM_OPTION = typer.Option(
+    None, "--platform", "-p", help="Platform (leetcode, aoc, etc.)"
+)
+CONFIG_OPTION = typer.Option(None, "--config", help="Config file")
+DEBUG_OPTION = typer.Option(False, "--debug", help="Debug mode")
+HISTORY_OPTION = typer.Option(None, "--history", help="Enable history")
+NO_HISTORY_OPTION = typer.Option(False, "--no-history", help="Disable history")
+SNAPSHOT_OPTION = typer.Option(
+    ...,
+    "--snapshot",
+    "-s",
+    help="Snapshot ID",
+    autocompletion=Completions.snapshots,
+)
@@ -1,14 +1,17 @@
 import json
-from dataclasses import asdict, dataclass, field
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, Optional
 
 # Configuration defaults - all constants at the top
 CONFIG_FILENAME = "challenge_cli_config.json"
+HOME_CONFIG_PATH = Path.home() / f".{CONFIG_FILENAME}"
 DEFAULT_PLATFORM = "leetcode"
 DEFAULT_LANGUAGE = "python"
 DEFAULT_FUNCTION_NAME = "solve"
 DEFAULT_PROBLEMS_DIR = Path.cwd()
+LOCAL_CONFIG_PATH = Path.cwd() / CONFIG_FILENAME
 DEFAULT_PROFILE_ITERATIONS = 100
 DOCKER_BUILD_TIMEOUT = 300
 DOCKER_RUN_TIMEOUT = 10
@@ -21,6 +24,21 @@ MAX_ERROR_DISPLAY_LENGTH = 1000
 # Global configuration instance
 _config: Optional["ChallengeConfig"] = None
 
+# Map JSON keys to config fields
+_FIELD_MAPPING = {
+    "default_platform": "platform",
+    "default_language": "language",
+    "problems_dir": "problems_dir",
+    "history_enabled": "history.enabled",
+    "history_max_snapshots": "history.max_snapshots",
+    "history_dir_name": "history.dir_name",
+    "docker_build_timeout": "docker.build_timeout",
+    "docker_run_timeout": "docker.run_timeout",
+    "docker_container_sleep": "docker.container_sleep",
+    "max_error_display_length": "max_error_display_length",
+    "profile_iterations": "profile_iterations",
+}
+
 
 @dataclass
 class CacheConfig:
@@ -105,29 +123,14 @@ class ChallengeConfig:
         """Create config from dictionary."""
         config_data = data.copy()
 
-        # Map JSON keys to config fields
-        field_mapping = {
-            "default_platform": "platform",
-            "default_language": "language",
-            "problems_dir": "problems_dir",
-            "history_enabled": "history.enabled",
-            "history_max_snapshots": "history.max_snapshots",
-            "history_dir_name": "history.dir_name",
-            "docker_build_timeout": "docker.build_timeout",
-            "docker_run_timeout": "docker.run_timeout",
-            "docker_container_sleep": "docker.container_sleep",
-            "max_error_display_length": "max_error_display_length",
-            "profile_iterations": "profile_iterations",
-        }
-
         # Process mapped fields
-        for json_key, config_key in field_mapping.items():
+        for json_key, config_key in _FIELD_MAPPING.items():
             if json_key in config_data:
                 value = config_data.pop(json_key)
                 if "." in config_key:  # Nested field
                     parent, child = config_key.split(".", 1)
-                    if parent not in config_data:
-                        config_data[parent] = {}
+                    # Copy nested sections so the cached file data stays untouched
+                    config_data[parent] = dict(config_data.get(parent, {}))
                     config_data[parent][child] = value
                 else:
                     config_data[config_key] = value
@@ -159,14 +162,27 @@ class ChallengeConfig:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert config to dictionary for serialization."""
-        data = asdict(self)
-        data["problems_dir"] = str(data["problems_dir"])
-        return data
+        # Nested sections only hold scalars, so shallow copies suffice
+        return {
+            "platform": self.platform,
+            "language": self.language,
+            "problems_dir": str(self.problems_dir),
+            "debug": self.debug,
+            "history": dict(vars(self.history)),
+            "docker": dict(vars(self.docker)),
+            "cache": dict(vars(self.cache)),
+            "platforms": {
+                name: {"language": platform.language, **platform.custom_settings}
+                for name, platform in self.platforms.items()
+            },
+            "profile_iterations": self.profile_iterations,
+            "max_error_display_length": self.max_error_display_length,
+        }
 
     def save(self, path: Optional[Path] = None) -> None:
         """Save configuration to file."""
         if path is None:
-            path = Path.home() / f".{CONFIG_FILENAME}"
+            path = HOME_CONFIG_PATH
 
         with open(path, "w") as f:
             json.dump(self.to_dict(), f, indent=2)
@@ -183,27 +199,33 @@ class ChallengeConfig:
         return self.problems_dir / ".cache"
 
 
+@lru_cache(maxsize=8)
+def _read_config_file(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file, memoized by path and modification time."""
+    with open(path, "r") as f:
+        return json.load(f)
+
+
 def load_config_file(config_path: Optional[Path] = None) -> Dict[str, Any]:
-    """Load configuration from file."""
-    paths = []
+    """Load configuration from file.
 
-    if config_path:
-        paths.append(Path(config_path))
+    Parsed files are cached by path and mtime, so repeated loads (e.g. from
+    shell completion callbacks) only cost a ``stat`` until the file changes.
+    """
+    paths = [LOCAL_CONFIG_PATH, HOME_CONFIG_PATH]
 
-    paths.extend(
-        [
-            Path.cwd() / CONFIG_FILENAME,
-            Path.home() / f".{CONFIG_FILENAME}",
-        ]
-    )
+    if config_path:
+        paths.insert(0, Path(config_path))
 
     for path in paths:
-        if path.exists():
-            try:
-                with open(path, "r") as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError):
-                continue
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            continue
+        try:
+            return dict(_read_config_file(str(path.absolute()), mtime_ns))
+        except (json.JSONDecodeError, IOError):
+            continue
 
     return {}
 
@@ -6,6 +6,9 @@ Constants used throughout the application.
 TESTCASES_FILENAME = "testcases.json"
 COMPLEXITY_FILENAME = "complexity.json"
 
+# Docker
+CONTAINER_PREFIX = "challenge-cli-"  # Prefix of every container the CLI manages
+
 # Language configuration
 # NOTE: These are now dynamically loaded from language plugins
 SUPPORTED_LANGUAGES = set()  # Will be populated by plugins
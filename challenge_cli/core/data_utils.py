@@ -1,6 +1,18 @@
 import json
+import re
 from typing import Any, Dict, List, Optional, Set, Union
 
+try:
+    import orjson
+except ImportError:  # Optional speedup, installed with the "fast" extra
+    orjson = None
+
+# First and last characters of strings worth handing to json.loads
+_JSON_BRACKETS = ("{}", "[]")
+
+# A single case number ("3") or an inclusive range ("5-7")
+_CASE_RE = re.compile(r"(\d+)(?:\s*-\s*(\d+))?")
+
 
 def load_json(
     file_path: str, default: Optional[Union[List, Dict]] = None
@@ -14,8 +26,8 @@ def load_json(
         Parsed JSON data or default value
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        with open(file_path, "rb") as f:
+            return _loads(f.read())
     except FileNotFoundError:
         return default if default is not None else {}
     except json.JSONDecodeError as e:
@@ -24,6 +36,16 @@ def load_json(
         return default if default is not None else {}
 
 
+def _loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # The stdlib also accepts NaN and integers wider than 64 bits
+    return json.loads(data)
+
+
 def save_json(file_path: str, data: Union[List, Dict]) -> None:
     """
     Save data to a JSON file.
@@ -58,42 +80,36 @@ def parse_cases_arg(cases_arg: Optional[str], total_cases: int) -> Set[int]:
         return set(range(1, total_cases + 1))
 
     selected_cases = set()
-    parts = cases_arg.split(",")
+    out_of_range = False
 
-    for part in parts:
+    for part in cases_arg.split(","):
         part = part.strip()
         if not part:
             continue
 
-        try:
-            if "-" in part:
-                start, end = map(int, part.split("-"))
-                if start <= 0 or end <= 0 or start > end:
-                    print(
-                        f"Warning: Invalid range '{part}' in cases argument. Skipping."
-                    )
-                    continue
-                selected_cases.update(range(start, end + 1))
-            else:
-                case_num = int(part)
-                if case_num <= 0:
-                    print(
-                        f"Warning: Invalid case number '{part}' in cases argument. Skipping."
-                    )
-                    continue
-                selected_cases.add(case_num)
-        except ValueError:
+        match = _CASE_RE.fullmatch(part)
+        if not match:
             print(f"Warning: Invalid format '{part}' in cases argument. Skipping.")
             continue
 
-    # Filter out cases that are out of the valid range
-    valid_selected_cases = {case for case in selected_cases if 1 <= case <= total_cases}
-    if len(valid_selected_cases) != len(selected_cases):
+        start = int(match[1])
+        end = int(match[2]) if match[2] else start
+        if start <= 0 or start > end:
+            kind = "range" if match[2] else "case number"
+            print(f"Warning: Invalid {kind} '{part}' in cases argument. Skipping.")
+            continue
+
+        # Clamp to the available cases instead of materializing huge ranges
+        if end > total_cases:
+            out_of_range = True
+        selected_cases.update(range(start, min(end, total_cases) + 1))
+
+    if out_of_range:
         print(
             f"Warning: Some selected cases are outside the valid range (1-{total_cases})."
         )
 
-    return valid_selected_cases
+    return selected_cases
 
 
 def compare_results(result: Any, expected: Any) -> bool:
@@ -108,25 +124,11 @@ def compare_results(result: Any, expected: Any) -> bool:
     Returns:
         True if results match, False otherwise
     """
-    # Attempt to parse expected if it's a string that looks like JSON
+    # Attempt to parse strings that look like JSON
     if isinstance(expected, str):
-        try:
-            if (expected.startswith("{") and expected.endswith("}")) or (
-                expected.startswith("[") and expected.endswith("]")
-            ):
-                expected = json.loads(expected)
-        except json.JSONDecodeError:
-            pass  # Keep original string if not valid JSON
-
-    # Attempt to parse result if it's a string that looks like JSON
+        expected = _parse_json_like(expected)
     if isinstance(result, str):
-        try:
-            if (result.startswith("{") and result.endswith("}")) or (
-                result.startswith("[") and result.endswith("]")
-            ):
-                result = json.loads(result)
-        except json.JSONDecodeError:
-            pass
+        result = _parse_json_like(result)
 
     # Handle list comparison: order might not matter for lists of simple types
     if isinstance(result, list) and isinstance(expected, list):
@@ -155,13 +157,14 @@ def parse_result(stdout: str) -> Union[Dict[str, Any], List[Any], str]:
     Returns:
         Parsed JSON if valid, otherwise stripped string
     """
-    stdout_stripped = stdout.strip()
-    try:
-        if (stdout_stripped.startswith("{") and stdout_stripped.endswith("}")) or (
-            stdout_stripped.startswith("[") and stdout_stripped.endswith("]")
-        ):
-            return json.loads(stdout_stripped)
-        else:
-            return stdout_stripped
-    except json.JSONDecodeError:
-        return stdout_stripped
+    return _parse_json_like(stdout.strip())
+
+
+def _parse_json_like(text: str) -> Any:
+    """Parse ``text`` as JSON if it is wrapped in braces or brackets."""
+    if text[:1] + text[-1:] in _JSON_BRACKETS:
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            pass  # Keep original string if not valid JSON
+    return text
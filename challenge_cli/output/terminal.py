@@ -7,7 +7,6 @@ from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
 from rich.rule import Rule
 from rich.style import Style
-from rich.syntax import Syntax
 from rich.table import Table
 from rich.text import Text
 from rich.tree import Tree
@@ -120,6 +119,9 @@ def _print_stdout_sample_panel(stdout: Optional[str], max_lines: int = 5):
 def _print_traceback_panel(traceback_str: Optional[str]):
     """Helper function to print a traceback in a panel if it exists."""
     if traceback_str:
+        # Import here: rich.syntax loads pygments, which only highlighting needs
+        from rich.syntax import Syntax
+
         syntax = Syntax(traceback_str, "python", theme="monokai", line_numbers=True)
         console.print(
             _create_panel(syntax, title="[red]Traceback[/red]", border_style=FAIL_STYLE)
@@ -262,6 +264,8 @@ def print_test_error(
         and traceback_str.strip() != error_msg.strip()
     )
     if show_traceback:
+        from rich.syntax import Syntax
+
         syntax = Syntax(
             traceback_str, "python", theme="monokai", line_numbers=True, word_wrap=True
         )
@@ -534,6 +538,8 @@ def print_snapshot_comparison(
 
     # Display diff
     if diff_lines:
+        from rich.syntax import Syntax
+
         syntax = Syntax(
             "\n".join(diff_lines), "diff", theme="monokai", line_numbers=True
         )
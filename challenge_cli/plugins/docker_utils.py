@@ -1,9 +1,10 @@
 import os
 import subprocess
 import time
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
 from challenge_cli.core.config import get_config
+from challenge_cli.core.constants import CONTAINER_PREFIX
 from challenge_cli.core.logging import (
     log_context,
     log_debug,
@@ -227,14 +228,29 @@ def execute_in_container(
             return "", str(e), -1
 
 
-@logged_operation("docker_shutdown_container")
-def shutdown_container(container_name: str) -> None:
-    """Stop and remove a container, cleaning up timestamp file."""
+def shutdown_container(container_name: str) -> bool:
+    """Stop and remove a container, cleaning up timestamp file.
+
+    Returns True if ``docker stop`` succeeded.
+    """
     with log_context(container=container_name):
-        log_info(f"Stopping container '{container_name}'")
-        subprocess.run(["docker", "stop", container_name], check=False)
-        _remove_container_timestamp(container_name)
-        log_debug(f"Container '{container_name}' stopped and timestamp cleaned up")
+        return shutdown_containers([container_name])
+
+
+@logged_operation("docker_shutdown_containers")
+def shutdown_containers(container_names: List[str]) -> bool:
+    """Stop containers with a single ``docker stop`` call, cleaning up timestamps.
+
+    Returns True if ``docker stop`` succeeded for every container.
+    """
+    if not container_names:
+        return True
+    log_info(f"Stopping containers: {', '.join(container_names)}")
+    result = subprocess.run(["docker", "stop", *container_names], check=False)
+    for name in container_names:
+        _remove_container_timestamp(name)
+    log_debug("Containers stopped and timestamps cleaned up")
+    return result.returncode == 0
 
 
 @logged_operation("docker_shutdown_all_containers")
@@ -243,10 +259,13 @@ def shutdown_all_containers() -> None:
     result = subprocess.run(
         ["docker", "ps", "--format", "{{.Names}}"], capture_output=True, text=True
     )
-    for name in result.stdout.splitlines():
-        if name.startswith("challenge-cli-"):  # Updated prefix
-            log_info(f"Stopping container: {name}")
-            shutdown_container(name)
+    shutdown_containers(
+        [
+            name
+            for name in result.stdout.splitlines()
+            if name.startswith(CONTAINER_PREFIX)
+        ]
+    )
     _cleanup_orphaned_timestamps()
     log_info("All challenge containers stopped and orphaned timestamps cleaned up")
 
@@ -283,7 +302,7 @@ def _remove_container_timestamp(container_name: str) -> None:
 def _cleanup_orphaned_timestamps() -> None:
     """Remove timestamp files for containers that no longer exist."""
     for filename in os.listdir("/tmp"):
-        if filename.startswith("challenge-cli-") and filename.endswith(".lastused"):
+        if filename.startswith(CONTAINER_PREFIX) and filename.endswith(".lastused"):
             timestamp_path = os.path.join("/tmp", filename)
             try:
                 os.remove(timestamp_path)
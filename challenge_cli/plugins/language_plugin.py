@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Tuple
 
 from challenge_cli.core.config import ChallengeConfig, get_config
+from challenge_cli.core.constants import CONTAINER_PREFIX
 from challenge_cli.plugins.docker_utils import (
     ensure_docker_image,
     execute_in_container,
@@ -288,7 +289,7 @@ class LanguagePlugin(ABC):
 
         if config.docker.container_sharing == "per-language":
             # Shared container for all challenges in this language
-            return f"challenge-cli-{self.name}"
+            return f"{CONTAINER_PREFIX}{self.name}"
         else:
             # Per-challenge container (legacy behavior)
             language_dir = os.path.abspath(workdir)
@@ -299,7 +300,7 @@ class LanguagePlugin(ABC):
             # Make challenge path safe for use in container name
             safe_challenge = challenge_path.replace("/", "-").replace("\\", "-")
 
-            return f"challenge-cli-{platform}-{safe_challenge}-{self.name}"
+            return f"{CONTAINER_PREFIX}{platform}-{safe_challenge}-{self.name}"
 
     def _get_problems_dir(self, workdir: str) -> str:
         """Get the problems directory root."""
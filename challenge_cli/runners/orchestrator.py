@@ -7,8 +7,6 @@ import time
 import traceback
 from typing import Any, Dict, List, Optional
 
-from challenge_cli.analysis.complexity import ComplexityAnalyzer
-from challenge_cli.analysis.visualization import HistoryVisualizer
 from challenge_cli.core.data_utils import parse_cases_arg
 from challenge_cli.core.formatting import format_memory, format_time
 from challenge_cli.history.manager import HistoryManager
@@ -81,14 +79,9 @@ class ChallengeTester:
             self.challenge_dir, self.platform, self.challenge_path
         )
 
-        # Initialize history manager if history is enabled
+        # History manager is created on first use by _initialize_history_manager,
+        # once the language for the operation is known
         self.history_manager = None
-        if self.use_history and self.language:
-            self.history_manager = HistoryManager(
-                challenge_dir=self.challenge_dir,
-                language=self.language,
-                max_snapshots=self.max_snapshots,
-            )
 
     def _initialize_history_manager(
         self, language: Optional[str] = None
@@ -544,6 +537,9 @@ class ChallengeTester:
         print_complexity_header()
 
         try:
+            # Import here so commands that never analyze skip loading it
+            from challenge_cli.analysis.complexity import ComplexityAnalyzer
+
             analyzer = ComplexityAnalyzer()
             complexity_results = analyzer.analyze_file(solution_path)
 
@@ -792,6 +788,8 @@ class ChallengeTester:
                     task, advance=1, description="Initializing visualizer..."
                 )
 
+                from challenge_cli.analysis.visualization import HistoryVisualizer
+
                 visualizer = HistoryVisualizer(
                     challenge_dir=self.challenge_dir, language=language
                 )
@@ -0,0 +1,66 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from challenge_cli.cli import app as app_module
+
+
+def test_imported_app_registers_every_command(monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["pytest", "-k", "test", "tests/cli"])
+
+    runner = CliRunner()
+    for command in (["history", "list"], ["cache", "show"], ["test"]):
+        result = runner.invoke(app_module.app, [*command, "--help"])
+        assert result.exit_code == 0, result.output
+
+
+def test_requested_command_uses_bash_cursor_position(monkeypatch):
+    monkeypatch.setenv("_CHALLENGE_CLI_COMPLETE", "complete_bash")
+    monkeypatch.setenv("COMP_WORDS", "challenge-cli history list -c two test")
+    monkeypatch.setenv("COMP_CWORD", "1")
+    assert app_module._requested_command() is None
+
+    monkeypatch.setenv("COMP_CWORD", "3")
+    assert app_module._requested_command() == "history"
+
+
+def test_requested_command_without_cursor_registers_everything(monkeypatch):
+    monkeypatch.setenv("_CHALLENGE_CLI_COMPLETE", "complete_zsh")
+    monkeypatch.delenv("COMP_CWORD", raising=False)
+    monkeypatch.setenv("_TYPER_COMPLETE_ARGS", "challenge-cli cache ")
+    assert app_module._requested_command() is None
+
+
+def test_disabled_history_exits_before_loading_plugins(tmp_path):
+    script = (
+        "import sys\n"
+        "from typer.testing import CliRunner\n"
+        "from challenge_cli.cli.app import app\n"
+        "args = ['history', 'list', '-c', 'x', '--no-history', '-l', 'py']\n"
+        "result = CliRunner().invoke(app, args)\n"
+        "print(result.output)\n"
+        "print('challenge_cli.plugins' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": str(Path(__file__).parents[2])},
+    )
+    assert "History is disabled" in result.stdout, result.stderr
+    assert result.stdout.split()[-1] == "False"
+
+
+def test_container_status_matches_exact_name(monkeypatch):
+    output = "challenge-cli-python\tUp 2 minutes\nchallenge-cli-py-old\tExited (0)\n"
+    monkeypatch.setattr(
+        app_module.subprocess,
+        "run",
+        lambda *args, **kwargs: subprocess.CompletedProcess(args, 0, output, ""),
+    )
+    assert app_module._container_status("challenge-cli-python") == "Up 2 minutes"
+    assert app_module._container_status("challenge-cli-py") is None
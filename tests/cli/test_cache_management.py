@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+from challenge_cli.cli import cache_management
+from challenge_cli.cli.cache_management import (
+    _iter_files,
+    format_size,
+    get_directory_size,
+)
+
+
+def _make_cache(root):
+    (root / "python" / "pkg").mkdir(parents=True)
+    (root / "python" / "pkg" / "mod.pyc").write_bytes(b"x" * 100)
+    (root / "go").mkdir()
+    (root / "go" / "build").write_bytes(b"x" * 50)
+    (root / "go" / "main.o").write_bytes(b"x" * 25)
+
+
+def test_format_size():
+    assert format_size(0) == "0.00 B"
+    assert format_size(1023) == "1023.00 B"
+    assert format_size(1024) == "1.00 KB"
+    assert format_size(1536) == "1.50 KB"
+    assert format_size(1048576) == "1.00 MB"
+    assert format_size(3 * 1024**4) == "3.00 TB"
+
+
+def test_get_directory_size_empty_and_missing(tmp_path):
+    assert get_directory_size(tmp_path) == 0
+    assert get_directory_size(tmp_path / "missing") == 0
+    assert list(_iter_files(tmp_path)) == []
+
+
+def test_get_directory_size_nested(tmp_path):
+    _make_cache(tmp_path)
+
+    assert get_directory_size(tmp_path) == 175
+    assert get_directory_size(tmp_path / "python") == 100
+    assert get_directory_size(tmp_path / "go") == 75
+    assert sorted(entry.name for entry in _iter_files(tmp_path)) == [
+        "build",
+        "main.o",
+        "mod.pyc",
+    ]
+
+
+def test_show_cache_statistics_per_language(tmp_path, monkeypatch, capsys):
+    _make_cache(tmp_path)
+    config = SimpleNamespace(get_cache_dir=lambda: tmp_path)
+    monkeypatch.setattr(cache_management, "get_config", lambda: config)
+
+    cache_management.show_cache_statistics()
+    output = capsys.readouterr().out
+
+    go_stats = output[output.index("go:") :]
+    python_stats = output[output.index("python:") :]
+    assert "Total Size: 75.00 B" in go_stats
+    assert "File Count: 2" in go_stats
+    assert "Total Size: 100.00 B" in python_stats
+    assert ".pyc: 1" in python_stats
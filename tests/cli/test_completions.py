@@ -0,0 +1,52 @@
+import os
+import time
+
+from challenge_cli.cli.completions import (
+    _challenge_cache_file,
+    _find_challenges,
+    _get_challenges,
+)
+
+
+def _make_tree(root):
+    for path in [
+        "two-sum/python",
+        "two-sum/.history/snapshots",
+        "2023/day1/part1/go",
+        "__pycache__",
+    ]:
+        (root / path).mkdir(parents=True)
+
+
+def _set_dir_mtimes(root, mtime):
+    for directory, _, _ in os.walk(root):
+        os.utime(directory, (mtime, mtime))
+
+
+def test_find_challenges_prunes_language_and_hidden_dirs(tmp_path):
+    _make_tree(tmp_path)
+    challenges, _ = _find_challenges(str(tmp_path))
+    assert challenges == ["2023", "2023/day1", "2023/day1/part1", "two-sum"]
+
+
+def test_get_challenges_refreshes_cache_on_change(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    platform_dir = tmp_path / "leetcode"
+    _make_tree(platform_dir)
+    _set_dir_mtimes(platform_dir, time.time() - 100)
+
+    assert "2023/day2" not in _get_challenges(str(platform_dir))
+    assert os.path.exists(_challenge_cache_file(str(platform_dir)))
+
+    (platform_dir / "2023" / "day2").mkdir()
+    _set_dir_mtimes(platform_dir, time.time() - 50)
+    assert "2023/day2" in _get_challenges(str(platform_dir))
+
+
+def test_get_challenges_skips_cache_for_recent_changes(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    platform_dir = tmp_path / "leetcode"
+    _make_tree(platform_dir)
+
+    assert "two-sum" in _get_challenges(str(platform_dir))
+    assert not os.path.exists(_challenge_cache_file(str(platform_dir)))
@@ -0,0 +1,41 @@
+import json
+import os
+
+from challenge_cli.core.config import ChallengeConfig, load_config_file
+
+
+def test_load_config_file_reloads_when_modified(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"default_platform": "aoc"}))
+    assert load_config_file(path)["default_platform"] == "aoc"
+
+    path.write_text(json.dumps({"default_platform": "leetcode"}))
+    os.utime(path, ns=(0, path.stat().st_mtime_ns + 1_000_000_000))
+    assert load_config_file(path)["default_platform"] == "leetcode"
+
+
+def test_from_dict_does_not_mutate_cached_config(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(
+        json.dumps({"history": {"enabled": True}, "history_enabled": False})
+    )
+
+    config = ChallengeConfig.from_dict(load_config_file(path))
+    assert config.history.enabled is False
+    assert load_config_file(path)["history"] == {"enabled": True}
+
+
+def test_to_dict_round_trips():
+    config = ChallengeConfig.from_dict(
+        {
+            "default_platform": "aoc",
+            "problems_dir": "/tmp/problems",
+            "history_max_snapshots": 5,
+            "platforms": {"aoc": {"language": "go", "year": 2023}},
+        }
+    )
+    data = config.to_dict()
+
+    assert data["problems_dir"] == "/tmp/problems"
+    assert data["platforms"] == {"aoc": {"language": "go", "year": 2023}}
+    assert ChallengeConfig.from_dict(data) == config
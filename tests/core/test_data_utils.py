@@ -1,13 +1,34 @@
-from challenge_cli.core.data_utils import compare_results, parse_cases_arg
+from challenge_cli.core.data_utils import (
+    compare_results,
+    parse_cases_arg,
+    parse_result,
+)
 
 
 def test_parse_cases_arg():
     assert parse_cases_arg("1,3,5-7", 10) == {1, 3, 5, 6, 7}
     assert parse_cases_arg(None, 5) == {1, 2, 3, 4, 5}
     assert parse_cases_arg("1-3", 10) == {1, 2, 3}
+    assert parse_cases_arg(" 2 - 4 ,, 9", 10) == {2, 3, 4, 9}
+
+
+def test_parse_cases_arg_skips_invalid_parts(capsys):
+    assert parse_cases_arg("0,3-1,x,-2,2", 5) == {2}
+    assert capsys.readouterr().out.count("Warning") == 4
+
+    assert parse_cases_arg("4-1000000", 5) == {4, 5}
+    assert "outside the valid range" in capsys.readouterr().out
 
 
 def test_compare_results():
     assert compare_results([1, 2], [2, 1])
     assert compare_results({"a": 1}, {"a": 1})
     assert compare_results("hello", "hello")
+
+
+def test_parse_result():
+    assert parse_result(' {"a": 1}\n') == {"a": 1}
+    assert parse_result("[1, 2]") == [1, 2]
+    assert parse_result("[1, 2") == "[1, 2"
+    assert parse_result("[not json]") == "[not json]"
+    assert parse_result("42\n") == "42"